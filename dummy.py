@@ -2,35 +2,75 @@ import tkinter as tk
 from tkinter import ttk, messagebox, colorchooser, font
 import json
 import os
+import re
 from datetime import datetime, timedelta
 import threading
 import time
+import queue
+import random
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
+from types import MappingProxyType
 import subprocess
 import sys
 from PIL import Image, ImageTk
-import win32gui
-import win32con
-import win32api
+try:
+    import win32gui
+    import win32con
+    import win32api
+    HAS_WIN32 = True
+except ImportError:
+    HAS_WIN32 = False
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+CONFIG_FILE = 'modern_widget_config.json'
+CONFIG_BUFFER_SIZE = 1 << 20  # config files are read/written in one buffered pass
+
+# Whole positive integers for size fields (checked before int() conversion)
+_INT_RE = re.compile(r'\d{1,5}')
+
+# Shared font objects keyed by (family, size, style); Tk resolves each spec once
+_font_cache = {}
+
+def get_font(family, size, style='normal'):
+    """Return a shared tkinter Font, creating it on first use"""
+    key = (family, size, style)
+    shared_font = _font_cache.get(key)
+    if shared_font is None:
+        shared_font = font.Font(
+            family=family,
+            size=size,
+            weight='bold' if style == 'bold' else 'normal',
+            slant='italic' if style == 'italic' else 'roman',
+            overstrike=1 if style == 'overstrike' else 0
+        )
+        _font_cache[key] = shared_font
+    return shared_font
 
 class ModernButton(tk.Frame):
     """Modern Material Design 3 button"""
+    
+    # Material Design 3 colors, shared by all buttons
+    _STYLES = MappingProxyType({
+        "filled": {"bg": "#6750A4", "fg": "#FFFFFF", "hover": "#7965AF"},
+        "outlined": {"bg": "#FFFFFF", "fg": "#6750A4", "hover": "#F7F2FA", "border": "#79747E"},
+        "text": {"bg": "#FFFFFF", "fg": "#6750A4", "hover": "#F7F2FA"},
+        "tonal": {"bg": "#E8DEF8", "fg": "#1D192B", "hover": "#DDD1EB"},
+        "danger": {"bg": "#B3261E", "fg": "#FFFFFF", "hover": "#C5362E"}
+    })
+    
     def __init__(self, parent, text, command, style="filled", **kwargs):
         super().__init__(parent, **kwargs)
         
         self.command = command
         self.style = style
         
-        # Material Design 3 colors
-        colors = {
-            "filled": {"bg": "#6750A4", "fg": "#FFFFFF", "hover": "#7965AF"},
-            "outlined": {"bg": "#FFFFFF", "fg": "#6750A4", "hover": "#F7F2FA", "border": "#79747E"},
-            "text": {"bg": "#FFFFFF", "fg": "#6750A4", "hover": "#F7F2FA"},
-            "tonal": {"bg": "#E8DEF8", "fg": "#1D192B", "hover": "#DDD1EB"},
-            "danger": {"bg": "#B3261E", "fg": "#FFFFFF", "hover": "#C5362E"}
-        }
-        
-        self.colors = colors.get(style, colors["filled"])
+        self.colors = self._STYLES.get(style, self._STYLES["filled"])
         
         self.configure(bg=self.colors["bg"], relief="flat", bd=0)
         
@@ -39,7 +79,7 @@ class ModernButton(tk.Frame):
             text=text, 
             bg=self.colors["bg"], 
             fg=self.colors["fg"],
-            font=("Segoe UI", 10, "normal"),
+            font=get_font("Segoe UI", 10, "normal"),
             cursor="hand2",
             pady=8,
             padx=16
@@ -89,7 +129,7 @@ class ModernCard(tk.Frame):
             title_label = tk.Label(
                 title_frame,
                 text=title,
-                font=("Segoe UI", 14, "bold"),
+                font=get_font("Segoe UI", 14, "bold"),
                 bg="#FFFFFF",
                 fg="#1C1B1F"
             )
@@ -97,98 +137,189 @@ class ModernCard(tk.Frame):
 
 class DesktopWidget:
     """Represents a widget that can be pinned to desktop"""
+    
+    __slots__ = ('_owner', 'x', 'y', 'desktop_window', 'is_pinned', 'hwnd', '_pending_xy')
+    
     def __init__(self, widget_instance, x=100, y=100):
-        self.widget_instance = widget_instance
+        # Weak back-reference: the widget_info entry owns the widget, not its desktop window
+        self._owner = weakref.ref(widget_instance)
         self.x = x
         self.y = y
         self.desktop_window = None
         self.is_pinned = False
+        self.hwnd = None
+        self._pending_xy = None
+    
+    @property
+    def widget_instance(self):
+        """The pinned widget, or None once it has been garbage collected"""
+        return self._owner()
     
     def pin_to_desktop(self):
         """Pin widget to desktop as desktop extension (behind other apps)"""
-        if self.is_pinned:
+        DesktopWidget.batch_pin([self])
+    
+    @classmethod
+    def batch_pin(cls, widgets):
+        """Pin several widgets at once, sending them to desktop level in one batch"""
+        widgets = [w for w in widgets if not w.is_pinned and w.widget_instance is not None]
+        if not widgets:
+            return
+        
+        for desktop_widget in widgets:
+            desktop_widget._create_desktop_window()
+        
+        # Send to desktop level (behind all other windows)
+        cls._send_to_desktop_level(widgets)
+        
+        for desktop_widget in widgets:
+            # Make draggable
+            desktop_widget._make_draggable()
+            desktop_widget.is_pinned = True
+    
+    def apply_config(self):
+        """Re-apply the widget config inside the existing desktop window"""
+        widget_instance = self.widget_instance
+        if not self.is_pinned or widget_instance is None:
             return
         
-        # Create desktop window
+        self.desktop_window.wm_attributes("-alpha", widget_instance.config.get('opacity', 0.9))
+        
+        # Rebuild only the content; the Toplevel and its desktop parenting are kept
+        if widget_instance.frame is not None:
+            widget_instance.frame.destroy()
+        widget_frame = widget_instance.create_widget(self.desktop_window)
+        widget_frame.pack()
+    
+    def _create_desktop_window(self):
+        """Create the borderless window holding the widget content"""
+        widget_instance = self.widget_instance
         self.desktop_window = tk.Toplevel()
         self.desktop_window.title("")
         self.desktop_window.overrideredirect(True)  # Remove window decorations
         
         # Make window stay behind other applications (desktop level)
         self.desktop_window.wm_attributes("-topmost", False)
-        self.desktop_window.wm_attributes("-alpha", self.widget_instance.config.get('opacity', 0.9))
+        self.desktop_window.wm_attributes("-alpha", widget_instance.config.get('opacity', 0.9))
         
         # Position on desktop
         self.desktop_window.geometry(f"+{self.x}+{self.y}")
         
         # Create widget content
-        widget_frame = self.widget_instance.create_widget(self.desktop_window)
+        widget_frame = widget_instance.create_widget(self.desktop_window)
         widget_frame.pack()
-        
-        # Send to desktop level (behind all other windows)
-        self._send_to_desktop_level()
-        
-        # Make draggable
-        self._make_draggable()
-        
-        self.is_pinned = True
     
-    def _send_to_desktop_level(self):
-        """Send window to desktop level using Windows API"""
+    @staticmethod
+    def _send_to_desktop_level(widgets):
+        """Send windows to desktop level using one deferred Windows API batch"""
+        if not HAS_WIN32:
+            print("win32gui not available - widgets will stay on top")
+            return
+        
         try:
-            import win32gui
-            import win32con
+            # Get window handles
+            hwnds = []
+            for desktop_widget in widgets:
+                desktop_widget.hwnd = int(desktop_widget.desktop_window.wm_frame(), 16)
+                hwnds.append(desktop_widget.hwnd)
             
-            # Get window handle
-            hwnd = int(self.desktop_window.wm_frame(), 16)
+            # Set windows to bottom of Z-order (desktop level)
+            DesktopWidget.defer_to_bottom(hwnds)
             
-            # Set window to bottom of Z-order (desktop level)
-            win32gui.SetWindowPos(
-                hwnd, 
-                win32con.HWND_BOTTOM,  # Place at bottom
-                0, 0, 0, 0,
-                win32con.SWP_NOMOVE | win32con.SWP_NOSIZE | win32con.SWP_NOACTIVATE
-            )
-            
-            # Additional: Set as desktop child window
+            # Additional: Set as desktop child windows
             desktop_hwnd = win32gui.GetDesktopWindow()
-            win32gui.SetParent(hwnd, desktop_hwnd)
+            for hwnd in hwnds:
+                win32gui.SetParent(hwnd, desktop_hwnd)
             
-        except ImportError:
-            print("win32gui not available - widgets will stay on top")
         except Exception as e:
             print(f"Could not send to desktop level: {e}")
     
+    @staticmethod
+    def defer_to_bottom(hwnds):
+        """Move windows to the bottom of the Z-order in a single deferred pass"""
+        if not HAS_WIN32 or not hwnds:
+            return
+        
+        # SWP_NOSENDCHANGING skips the WM_WINDOWPOSCHANGING round-trip
+        flags = (win32con.SWP_NOMOVE | win32con.SWP_NOSIZE |
+                 win32con.SWP_NOACTIVATE | win32con.SWP_NOSENDCHANGING)
+        hdwp = win32gui.BeginDeferWindowPos(len(hwnds))
+        for hwnd in hwnds:
+            hdwp = win32gui.DeferWindowPos(hdwp, hwnd, win32con.HWND_BOTTOM, 0, 0, 0, 0, flags)
+        win32gui.EndDeferWindowPos(hdwp)
+    
     def _make_draggable(self):
         """Make the widget draggable"""
         def start_drag(event):
-            self.desktop_window.start_x = event.x
-            self.desktop_window.start_y = event.y
+            # Grab offset in screen coordinates; event.x/y are relative to
+            # whichever child label received the click
+            self.desktop_window.start_x = event.x_root - self.x
+            self.desktop_window.start_y = event.y_root - self.y
         
         def do_drag(event):
-            x = self.desktop_window.winfo_x() + event.x - self.desktop_window.start_x
-            y = self.desktop_window.winfo_y() + event.y - self.desktop_window.start_y
-            self.desktop_window.geometry(f"+{x}+{y}")
-            self.x, self.y = x, y
+            self.move_to(event.x_root - self.desktop_window.start_x,
+                         event.y_root - self.desktop_window.start_y)
         
         self.desktop_window.bind("<Button-1>", start_drag)
         self.desktop_window.bind("<B1-Motion>", do_drag)
     
+    def move_to(self, x, y):
+        """Move the window; repeated calls are coalesced into one move per idle pass"""
+        if self._pending_xy is None:
+            self.desktop_window.after_idle(self._flush_move)
+        self._pending_xy = (x, y)
+    
+    def _flush_move(self):
+        """Apply the most recent requested position with a single window move"""
+        if self._pending_xy is None or not self.desktop_window:
+            self._pending_xy = None
+            return
+        x, y = self._pending_xy
+        self._pending_xy = None
+        self.x, self.y = x, y
+        
+        if HAS_WIN32 and self.hwnd:
+            try:
+                win32gui.SetWindowPos(
+                    self.hwnd, 0, x, y, 0, 0,
+                    win32con.SWP_NOZORDER | win32con.SWP_NOSIZE |
+                    win32con.SWP_NOACTIVATE | win32con.SWP_NOSENDCHANGING
+                )
+                return
+            except Exception:
+                pass
+        self.desktop_window.geometry(f"+{x}+{y}")
+    
     def unpin_from_desktop(self):
         """Remove widget from desktop"""
         if self.desktop_window:
+            widget_instance = self.widget_instance
+            if widget_instance is not None:
+                widget_instance.destroy()
             self.desktop_window.destroy()
             self.desktop_window = None
+            self._pending_xy = None
             self.is_pinned = False
 
 class BaseWidget(ABC):
-    """Abstract base class for all widgets with modern styling"""
+    """Abstract base class for all widgets with modern styling
+    
+    Widget callbacks must never call self.master.update(): it re-enters the
+    event loop and can reorder pending callbacks. Use _flush() when a redraw
+    really has to happen before returning to the mainloop.
+    """
+    
+    # __weakref__ lets the shared ticker hold widgets in a WeakSet
+    __slots__ = ('master', 'config', 'frame', '_cache', '__weakref__')
+    
+    # Shared once-per-second ticker, set by the WidgetManager on startup
+    ticker = None
     
     def __init__(self, master, config=None):
         self.master = master
         self.config = config or self.get_default_config()
         self.frame = None
-        self.update_job = None
+        self._cache = {}  # last value set per (widget, option), see _set
         
     @abstractmethod
     def get_default_config(self):
@@ -205,6 +336,36 @@ class BaseWidget(ABC):
         """Update widget content"""
         pass
     
+    def _set(self, widget, attr, value, cache_key=None):
+        """Configure a widget option only if it differs from the last value set"""
+        key = cache_key or (str(widget), attr)
+        if self._cache.get(key) == value:
+            return
+        widget.configure(**{attr: value})
+        self._cache[key] = value
+    
+    def destroy(self):
+        """Release live resources; the widget is only materialized again by create_widget"""
+        # Dropping the frame also unsubscribes the widget on the next tick (see on_tick)
+        self.frame = None
+    
+    def _flush(self):
+        """Run pending idle tasks (redraws, geometry) without processing input events"""
+        if self.frame is not None and self.frame.winfo_exists():
+            self.frame.update_idletasks()
+    
+    def subscribe_to_ticker(self):
+        """Receive on_tick calls from the shared ticker instead of scheduling own timers"""
+        if BaseWidget.ticker is not None:
+            BaseWidget.ticker.subscribe(self)
+    
+    def on_tick(self, now):
+        """Handle a shared tick; returns False once the widget is gone so it gets unsubscribed"""
+        if self.frame is None or not self.frame.winfo_exists():
+            return False
+        self.update_content(now)
+        return True
+    
     def apply_modern_styling(self, widget):
         """Apply modern Material Design styling"""
         if hasattr(widget, 'configure'):
@@ -215,7 +376,7 @@ class BaseWidget(ABC):
             widget.configure(
                 bg=bg_color,
                 fg=text_color,
-                font=("Segoe UI", self.config.get('font_size', 12)),
+                font=get_font("Segoe UI", self.config.get('font_size', 12)),
                 relief="flat",
                 bd=0
             )
@@ -223,19 +384,23 @@ class BaseWidget(ABC):
 class ClockWidget(BaseWidget):
     """Modern digital clock widget"""
     
+    __slots__ = ('time_label', 'date_label', '_cached_date_ord', '_cached_date_str')
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        'width': 280,
+        'height': 120,
+        'bg_color': '#1C1B1F',
+        'text_color': '#FFFFFF',
+        'accent_color': '#D0BCFF',
+        'font_family': 'Segoe UI',
+        'font_size': 18,
+        'opacity': 0.95,
+        'format_12h': True,
+        'corner_radius': 16
+    })
+    
     def get_default_config(self):
-        return {
-            'width': 280,
-            'height': 120,
-            'bg_color': '#1C1B1F',
-            'text_color': '#FFFFFF',
-            'accent_color': '#D0BCFF',
-            'font_family': 'Segoe UI',
-            'font_size': 18,
-            'opacity': 0.95,
-            'format_12h': True,
-            'corner_radius': 16
-        }
+        return dict(self._DEFAULT_CONFIG)
     
     def create_widget(self, parent):
         # Main container with rounded corners effect
@@ -245,9 +410,10 @@ class ClockWidget(BaseWidget):
             relief="flat",
             bd=0,
             padx=20,
-            pady=16
+            pady=16,
+            width=self.config['width'],
+            height=self.config['height']
         )
-        self.frame.configure(width=self.config['width'], height=self.config['height'])
         
         # Time display
         self.time_label = tk.Label(
@@ -255,7 +421,7 @@ class ClockWidget(BaseWidget):
             text="00:00:00",
             bg=self.config['bg_color'],
             fg=self.config['text_color'],
-            font=(self.config['font_family'], self.config['font_size'] + 8, 'normal'),
+            font=get_font(self.config['font_family'], self.config['font_size'] + 8, 'normal'),
             anchor='center'
         )
         self.time_label.pack(expand=True, pady=(8, 4))
@@ -266,84 +432,109 @@ class ClockWidget(BaseWidget):
             text="",
             bg=self.config['bg_color'],
             fg=self.config['accent_color'],
-            font=(self.config['font_family'], self.config['font_size'] - 2, 'normal'),
+            font=get_font(self.config['font_family'], self.config['font_size'] - 2, 'normal'),
             anchor='center'
         )
         self.date_label.pack(expand=True, pady=(0, 8))
         
+        # Date text only changes once a day; labels are only reconfigured on change
+        self._cached_date_ord = None
+        self._cached_date_str = ""
+        self._cache.clear()
+        
         self.update_content()
+        self.subscribe_to_ticker()
         return self.frame
     
-    def update_content(self):
+    def update_content(self, now=None):
         if hasattr(self, 'time_label') and self.time_label.winfo_exists():
-            now = datetime.now()
+            now = now or datetime.now()
             if self.config.get('format_12h', True):
-                time_str = now.strftime("%I:%M:%S %p")
+                hour = now.hour % 12 or 12
+                period = "AM" if now.hour < 12 else "PM"
+                time_str = f"{hour:02d}:{now.minute:02d}:{now.second:02d} {period}"
             else:
-                time_str = now.strftime("%H:%M:%S")
+                time_str = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
             
-            date_str = now.strftime("%A, %B %d")
+            self._set(self.time_label, 'text', time_str)
             
-            self.time_label.configure(text=time_str)
-            self.date_label.configure(text=date_str)
-            
-            # Schedule next update
-            self.master.after(1000, self.update_content)
+            date_ord = now.toordinal()
+            if date_ord != self._cached_date_ord:
+                self._cached_date_ord = date_ord
+                self._cached_date_str = now.strftime("%A, %B %d")
+            self._set(self.date_label, 'text', self._cached_date_str)
 
 class TodoWidget(BaseWidget):
     """Modern to-do list widget"""
     
+    __slots__ = ('entry', 'tasks_frame', 'tasks', 'task_widgets', '_row_pool', '_next_task_id')
+    
+    # Click bindings for the shared TodoCheck/TodoDelete bind tags; registered once
+    # per interpreter since Tk only frees class bindings with the root
+    _bindings_ready = False
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        'width': 320,
+        'height': 400,
+        'bg_color': '#FFFFFF',
+        'text_color': '#1C1B1F',
+        'accent_color': '#6750A4',
+        'surface_color': '#F7F2FA',
+        'font_family': 'Segoe UI',
+        'font_size': 11,
+        'opacity': 0.95,
+        'max_items': 10
+    })
+    
     def get_default_config(self):
-        return {
-            'width': 320,
-            'height': 400,
-            'bg_color': '#FFFFFF',
-            'text_color': '#1C1B1F',
-            'accent_color': '#6750A4',
-            'surface_color': '#F7F2FA',
-            'font_family': 'Segoe UI',
-            'font_size': 11,
-            'opacity': 0.95,
-            'max_items': 10
-        }
+        return dict(self._DEFAULT_CONFIG)
     
     def create_widget(self, parent):
+        # Hoist config lookups out of the construction code
+        bg = self.config['bg_color']
+        fg = self.config['text_color']
+        accent = self.config['accent_color']
+        surface = self.config['surface_color']
+        family = self.config['font_family']
+        size = self.config['font_size']
+        
         self.frame = tk.Frame(
             parent, 
-            bg=self.config['bg_color'],
+            bg=bg,
             relief="flat",
             bd=0,
             padx=16,
-            pady=16
+            pady=16,
+            width=self.config['width'],
+            height=self.config['height']
         )
-        self.frame.configure(width=self.config['width'], height=self.config['height'])
         
         # Header
-        header_frame = tk.Frame(self.frame, bg=self.config['bg_color'])
+        header_frame = tk.Frame(self.frame, bg=bg)
         header_frame.pack(fill='x', pady=(0, 12))
         
         title = tk.Label(
             header_frame,
             text="Tasks",
-            bg=self.config['bg_color'],
-            fg=self.config['text_color'],
-            font=(self.config['font_family'], self.config['font_size'] + 6, 'bold')
+            bg=bg,
+            fg=fg,
+            font=get_font(family, size + 6, 'bold')
         )
         title.pack(anchor='w')
         
         # Input section
-        input_frame = tk.Frame(self.frame, bg=self.config['surface_color'], relief="flat")
+        input_frame = tk.Frame(self.frame, bg=surface, relief="flat")
         input_frame.pack(fill='x', pady=(0, 16))
         input_frame.configure(padx=12, pady=8)
         
         self.entry = tk.Entry(
             input_frame,
-            bg=self.config['surface_color'],
-            fg=self.config['text_color'],
-            font=(self.config['font_family'], self.config['font_size']),
+            bg=surface,
+            fg=fg,
+            font=get_font(family, size),
             relief="flat",
             bd=0,
-            insertbackground=self.config['accent_color']
+            insertbackground=accent
         )
         self.entry.pack(side='left', fill='x', expand=True, padx=(0, 8))
         self.entry.bind('<Return>', self.add_task)
@@ -357,101 +548,217 @@ class TodoWidget(BaseWidget):
         add_btn.pack(side='right')
         
         # Tasks container
-        tasks_container = tk.Frame(self.frame, bg=self.config['bg_color'])
+        tasks_container = tk.Frame(self.frame, bg=bg)
         tasks_container.pack(fill='both', expand=True)
         
         # Custom listbox styling
-        self.tasks_frame = tk.Frame(tasks_container, bg=self.config['bg_color'])
+        self.tasks_frame = tk.Frame(tasks_container, bg=bg)
         self.tasks_frame.pack(fill='both', expand=True)
         
-        self.tasks = []
-        self.task_widgets = []
+        # One handler per action for the rows of every todo widget: rows carry a
+        # bind tag, a weak ref to their TodoWidget and a _task_id
+        if not TodoWidget._bindings_ready:
+            self.tasks_frame.bind_class("TodoCheck", "<Button-1>", TodoWidget._on_checkbox_click)
+            self.tasks_frame.bind_class("TodoDelete", "<Button-1>", TodoWidget._on_delete_click)
+            TodoWidget._bindings_ready = True
+        
+        self._cache.clear()
+        # Tasks survive re-creation (e.g. after customization); rows are rebuilt below
+        if not hasattr(self, 'tasks'):
+            self.tasks = []
+            self._next_task_id = 0
+        self.task_widgets = {}  # task id -> (frame, checkbox, label, delete_btn)
+        self._row_pool = []  # hidden rows kept for reuse instead of destroy/recreate
         self.update_content()
         return self.frame
     
     def add_task(self, event=None):
         task_text = self.entry.get().strip()
         if task_text:
-            self.tasks.append({'text': task_text, 'completed': False})
+            task = {'id': self._next_task_id, 'text': task_text, 'completed': False}
+            self._next_task_id += 1
+            self.tasks.append(task)
             self.entry.delete(0, 'end')
-            self.update_content()
+            self._create_task_row(task)
     
     def toggle_task(self, index):
         if 0 <= index < len(self.tasks):
-            self.tasks[index]['completed'] = not self.tasks[index]['completed']
-            self.update_content()
+            self.toggle_task_by_id(self.tasks[index]['id'])
     
     def delete_task(self, index):
         if 0 <= index < len(self.tasks):
-            del self.tasks[index]
-            self.update_content()
+            self.delete_task_by_id(self.tasks[index]['id'])
+    
+    @staticmethod
+    def _on_checkbox_click(event):
+        owner = event.widget._todo()
+        if owner is not None:
+            owner.toggle_task_by_id(getattr(event.widget, '_task_id', None))
+    
+    @staticmethod
+    def _on_delete_click(event):
+        owner = event.widget._todo()
+        if owner is not None:
+            owner.delete_task_by_id(getattr(event.widget, '_task_id', None))
+    
+    def toggle_task_by_id(self, task_id):
+        for task in self.tasks:
+            if task['id'] == task_id:
+                task['completed'] = not task['completed']
+                self._update_task_row(task)
+                break
+    
+    def delete_task_by_id(self, task_id):
+        self.tasks = [task for task in self.tasks if task['id'] != task_id]
+        row = self.task_widgets.pop(task_id, None)
+        if row:
+            self._release_row(row)
     
     def update_content(self):
-        # Clear existing task widgets
-        for widget in self.task_widgets:
-            widget.destroy()
-        self.task_widgets = []
-        
-        # Create task items
-        for i, task in enumerate(self.tasks):
-            task_item = tk.Frame(self.tasks_frame, bg=self.config['surface_color'], pady=8, padx=12)
+        """Sync task rows with self.tasks, touching only rows that changed"""
+        # Remove rows whose task is gone
+        live_ids = {task['id'] for task in self.tasks}
+        stale_ids = [tid for tid in self.task_widgets if tid not in live_ids]
+        for task_id in stale_ids:
+            self._release_row(self.task_widgets.pop(task_id))
+        
+        created = 0
+        for task in self.tasks:
+            if task['id'] in self.task_widgets:
+                self._update_task_row(task)
+            else:
+                self._create_task_row(task)
+                created += 1
+        
+        # Bulk changes: redraw now rather than leaving a half-built list on screen
+        if stale_ids or created > 1:
+            self._flush()
+    
+    def _create_task_row(self, task):
+        """Show the row widgets for a single task, reusing a pooled row if available"""
+        if self._row_pool:
+            row = self._row_pool.pop()
+            task_item, checkbox, task_label, delete_btn = row
+            checkbox._task_id = delete_btn._task_id = task['id']
             task_item.pack(fill='x', pady=2)
-            
-            # Checkbox effect
-            checkbox = tk.Label(
-                task_item,
-                text="✓" if task['completed'] else "○",
-                bg=self.config['surface_color'],
-                fg=self.config['accent_color'] if task['completed'] else self.config['text_color'],
-                font=(self.config['font_family'], self.config['font_size'] + 2),
-                cursor="hand2"
-            )
-            checkbox.pack(side='left', padx=(0, 8))
-            checkbox.bind("<Button-1>", lambda e, idx=i: self.toggle_task(idx))
-            
-            # Task text
-            text_color = '#79747E' if task['completed'] else self.config['text_color']
-            font_style = 'overstrike' if task['completed'] else 'normal'
-            
-            task_label = tk.Label(
-                task_item,
-                text=task['text'],
-                bg=self.config['surface_color'],
-                fg=text_color,
-                font=(self.config['font_family'], self.config['font_size'], font_style),
-                anchor='w'
-            )
-            task_label.pack(side='left', fill='x', expand=True)
-            
-            # Delete button
-            delete_btn = tk.Label(
-                task_item,
-                text="×",
-                bg=self.config['surface_color'],
-                fg='#B3261E',
-                font=(self.config['font_family'], self.config['font_size'] + 4),
-                cursor="hand2"
-            )
-            delete_btn.pack(side='right')
-            delete_btn.bind("<Button-1>", lambda e, idx=i: self.delete_task(idx))
-            
-            self.task_widgets.append(task_item)
+            task_label.configure(text=task['text'])
+            self.task_widgets[task['id']] = row
+            self._update_task_row(task)
+            return
+        
+        surface = self.config['surface_color']
+        fg = self.config['text_color']
+        family = self.config['font_family']
+        size = self.config['font_size']
+        
+        task_item = tk.Frame(self.tasks_frame, bg=surface, pady=8, padx=12)
+        task_item.pack(fill='x', pady=2)
+        
+        # Checkbox effect
+        checkbox = tk.Label(
+            task_item,
+            text="○",
+            bg=surface,
+            fg=fg,
+            font=get_font(family, size + 2),
+            cursor="hand2"
+        )
+        checkbox.pack(side='left', padx=(0, 8))
+        checkbox.bindtags(("TodoCheck",) + checkbox.bindtags())
+        checkbox._todo = weakref.ref(self)
+        checkbox._task_id = task['id']
+        
+        # Task text
+        task_label = tk.Label(
+            task_item,
+            text=task['text'],
+            bg=surface,
+            fg=fg,
+            font=get_font(family, size, 'normal'),
+            anchor='w'
+        )
+        task_label.pack(side='left', fill='x', expand=True)
+        
+        # Delete button
+        delete_btn = tk.Label(
+            task_item,
+            text="×",
+            bg=surface,
+            fg='#B3261E',
+            font=get_font(family, size + 4),
+            cursor="hand2"
+        )
+        delete_btn.pack(side='right')
+        delete_btn.bindtags(("TodoDelete",) + delete_btn.bindtags())
+        delete_btn._todo = weakref.ref(self)
+        delete_btn._task_id = task['id']
+        
+        self.task_widgets[task['id']] = (task_item, checkbox, task_label, delete_btn)
+        if task['completed']:
+            self._update_task_row(task)
+    
+    def _release_row(self, row):
+        """Hide a row and keep it for reuse, destroying it once the pool is full"""
+        if len(self._row_pool) < 2 * self.config.get('max_items', 10):
+            row[0].pack_forget()
+            row[1]._task_id = row[3]._task_id = None
+            self._row_pool.append(row)
+        else:
+            # Forget the destroyed labels' _set entries; Tk never reuses their names
+            names = {str(row[1]), str(row[2])}
+            for key in [key for key in self._cache if key[0] in names]:
+                del self._cache[key]
+            row[0].destroy()
+    
+    def _update_task_row(self, task):
+        """Relabel an existing row to match its task's completed state"""
+        _, checkbox, task_label, _ = self.task_widgets[task['id']]
+        completed = task['completed']
+        fg = self.config['text_color']
+        accent = self.config['accent_color']
+        family = self.config['font_family']
+        size = self.config['font_size']
+        
+        self._set(checkbox, 'text', "✓" if completed else "○")
+        self._set(checkbox, 'fg', accent if completed else fg)
+        self._set(task_label, 'fg', '#79747E' if completed else fg)
+        self._set(task_label, 'font', get_font(family, size, 'overstrike' if completed else 'normal'))
 
 class WeatherWidget(BaseWidget):
     """Modern weather widget"""
     
+    __slots__ = ('location_label', 'temp_label', 'condition_label', 'humidity_label',
+                 '_queue', '_stop_event', '_fetch_thread', '_latest', '_rng', '_sim_cache')
+    
+    # Simulated weather values, sampled in batches
+    _SIM_TEMPERATURES = (-10, -5, 0, 5, 10, 15, 20, 25)
+    _SIM_CONDITIONS = ("Sunny", "Cloudy", "Partly Cloudy", "Light Snow", "Snow")
+    _SIM_BATCH = 16
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        'width': 300,
+        'height': 200,
+        'bg_color': '#E3F2FD',
+        'text_color': '#1565C0',
+        'accent_color': '#2196F3',
+        'font_family': 'Segoe UI',
+        'font_size': 12,
+        'opacity': 0.95,
+        'location': 'Calgary, AB'
+    })
+    
+    def __init__(self, master, config=None):
+        super().__init__(master, config)
+        # Weather is fetched on a worker thread; results reach the GUI through a queue
+        self._queue = queue.Queue()
+        self._stop_event = threading.Event()
+        self._fetch_thread = None
+        self._latest = None
+        self._rng = random.Random()
+        self._sim_cache = deque()
+    
     def get_default_config(self):
-        return {
-            'width': 300,
-            'height': 200,
-            'bg_color': '#E3F2FD',
-            'text_color': '#1565C0',
-            'accent_color': '#2196F3',
-            'font_family': 'Segoe UI',
-            'font_size': 12,
-            'opacity': 0.95,
-            'location': 'Calgary, AB'
-        }
+        return dict(self._DEFAULT_CONFIG)
     
     def create_widget(self, parent):
         self.frame = tk.Frame(
@@ -460,9 +767,10 @@ class WeatherWidget(BaseWidget):
             relief="flat",
             bd=0,
             padx=20,
-            pady=16
+            pady=16,
+            width=self.config['width'],
+            height=self.config['height']
         )
-        self.frame.configure(width=self.config['width'], height=self.config['height'])
         
         # Location header
         self.location_label = tk.Label(
@@ -470,7 +778,7 @@ class WeatherWidget(BaseWidget):
             text=self.config['location'],
             bg=self.config['bg_color'],
             fg=self.config['text_color'],
-            font=(self.config['font_family'], self.config['font_size'], 'bold')
+            font=get_font(self.config['font_family'], self.config['font_size'], 'bold')
         )
         self.location_label.pack(pady=(0, 8))
         
@@ -484,7 +792,7 @@ class WeatherWidget(BaseWidget):
             text="--°C",
             bg=self.config['bg_color'],
             fg=self.config['accent_color'],
-            font=(self.config['font_family'], self.config['font_size'] + 16, 'normal')
+            font=get_font(self.config['font_family'], self.config['font_size'] + 16, 'normal')
         )
         self.temp_label.pack()
         
@@ -494,7 +802,7 @@ class WeatherWidget(BaseWidget):
             text="--",
             bg=self.config['bg_color'],
             fg=self.config['text_color'],
-            font=(self.config['font_family'], self.config['font_size'] + 2)
+            font=get_font(self.config['font_family'], self.config['font_size'] + 2)
         )
         self.condition_label.pack(pady=8)
         
@@ -507,44 +815,85 @@ class WeatherWidget(BaseWidget):
             text="Humidity: --%",
             bg=self.config['bg_color'],
             fg=self.config['text_color'],
-            font=(self.config['font_family'], self.config['font_size'] - 1)
+            font=get_font(self.config['font_family'], self.config['font_size'] - 1)
         )
         self.humidity_label.pack()
         
+        self._cache.clear()
         self.update_content()
+        self.subscribe_to_ticker()
+        self._start_fetcher()
         return self.frame
     
-    def update_content(self):
-        # Simulate weather data
-        import random
-        temperatures = [-10, -5, 0, 5, 10, 15, 20, 25]
-        conditions = ["Sunny", "Cloudy", "Partly Cloudy", "Light Snow", "Snow"]
+    def _start_fetcher(self):
+        if self._fetch_thread is None:
+            self._stop_event = threading.Event()
+            self._fetch_thread = threading.Thread(
+                target=self._fetch_loop, args=(self._stop_event,), daemon=True
+            )
+            self._fetch_thread.start()
+    
+    def _fetch_loop(self, stop_event):
+        """Worker thread: fetch weather every 10 minutes. Never touches Tk widgets."""
+        while not stop_event.is_set():
+            self._queue.put(self._fetch_weather())
+            stop_event.wait(600)  # 10 minutes
+    
+    def _fetch_weather(self):
+        # Simulate weather data, generating a batch of readings at a time
+        if not self._sim_cache:
+            n = self._SIM_BATCH
+            temps = self._rng.choices(self._SIM_TEMPERATURES, k=n)
+            conditions = self._rng.choices(self._SIM_CONDITIONS, k=n)
+            humidities = [self._rng.randint(30, 90) for _ in range(n)]
+            self._sim_cache.extend(zip(temps, conditions, humidities))
+        return self._sim_cache.popleft()
+    
+    def update_content(self, now=None):
+        # Drain results posted by the worker thread
+        try:
+            while True:
+                self._latest = self._queue.get_nowait()
+        except queue.Empty:
+            pass
         
-        temp = random.choice(temperatures)
-        condition = random.choice(conditions)
-        humidity = random.randint(30, 90)
+        if self._latest is None:
+            return
         
         if hasattr(self, 'temp_label') and self.temp_label.winfo_exists():
-            self.temp_label.configure(text=f"{temp}°C")
-            self.condition_label.configure(text=condition)
-            self.humidity_label.configure(text=f"Humidity: {humidity}%")
-            
-            self.master.after(600000, self.update_content)  # 10 minutes
+            temp, condition, humidity = self._latest
+            self._set(self.temp_label, 'text', f"{temp}°C")
+            self._set(self.condition_label, 'text', condition)
+            self._set(self.humidity_label, 'text', f"Humidity: {humidity}%")
+    
+    def destroy(self):
+        """Stop fetching while unpinned; pinning again restarts the worker"""
+        super().destroy()
+        self.cleanup()
+    
+    def cleanup(self):
+        """Stop the background fetch thread"""
+        self._stop_event.set()
+        self._fetch_thread = None
 
 class TimerWidget(BaseWidget):
     """Modern timer widget"""
     
+    __slots__ = ('time_display', 'minutes_var', 'start_btn', 'stop_btn', '_deadline', 'timer_active')
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        'width': 250,
+        'height': 180,
+        'bg_color': '#FFF3E0',
+        'text_color': '#E65100',
+        'accent_color': '#FF9800',
+        'font_family': 'Segoe UI',
+        'font_size': 14,
+        'opacity': 0.95
+    })
+    
     def get_default_config(self):
-        return {
-            'width': 250,
-            'height': 180,
-            'bg_color': '#FFF3E0',
-            'text_color': '#E65100',
-            'accent_color': '#FF9800',
-            'font_family': 'Segoe UI',
-            'font_size': 14,
-            'opacity': 0.95
-        }
+        return dict(self._DEFAULT_CONFIG)
     
     def create_widget(self, parent):
         self.frame = tk.Frame(
@@ -553,9 +902,10 @@ class TimerWidget(BaseWidget):
             relief="flat",
             bd=0,
             padx=20,
-            pady=16
+            pady=16,
+            width=self.config['width'],
+            height=self.config['height']
         )
-        self.frame.configure(width=self.config['width'], height=self.config['height'])
         
         # Title
         title = tk.Label(
@@ -563,7 +913,7 @@ class TimerWidget(BaseWidget):
             text="Timer",
             bg=self.config['bg_color'],
             fg=self.config['text_color'],
-            font=(self.config['font_family'], self.config['font_size'] + 2, 'bold')
+            font=get_font(self.config['font_family'], self.config['font_size'] + 2, 'bold')
         )
         title.pack(pady=(0, 12))
         
@@ -573,7 +923,7 @@ class TimerWidget(BaseWidget):
             text="00:00",
             bg=self.config['bg_color'],
             fg=self.config['accent_color'],
-            font=(self.config['font_family'], self.config['font_size'] + 10, 'bold')
+            font=get_font(self.config['font_family'], self.config['font_size'] + 10, 'bold')
         )
         self.time_display.pack(pady=8)
         
@@ -586,7 +936,7 @@ class TimerWidget(BaseWidget):
             input_frame,
             textvariable=self.minutes_var,
             width=5,
-            font=(self.config['font_family'], self.config['font_size']),
+            font=get_font(self.config['font_family'], self.config['font_size']),
             bg='white',
             fg=self.config['text_color'],
             relief="flat",
@@ -600,7 +950,7 @@ class TimerWidget(BaseWidget):
             text="minutes",
             bg=self.config['bg_color'],
             fg=self.config['text_color'],
-            font=(self.config['font_family'], self.config['font_size'])
+            font=get_font(self.config['font_family'], self.config['font_size'])
         ).pack(side='left')
         
         # Control buttons
@@ -623,42 +973,76 @@ class TimerWidget(BaseWidget):
         )
         self.stop_btn.pack(side='left')
         
-        self.remaining_time = 0
-        self.timer_active = False
+        self._cache.clear()
+        # A running timer keeps going when the widget is re-created
+        if not hasattr(self, 'timer_active'):
+            self._deadline = 0.0
+            self.timer_active = False
         self.update_content()
+        self.subscribe_to_ticker()
         return self.frame
     
     def start_timer(self):
         try:
             minutes = int(self.minutes_var.get())
-            self.remaining_time = minutes * 60
+            # Absolute deadline so late or missed ticks never accumulate drift
+            self._deadline = time.monotonic() + minutes * 60
             self.timer_active = True
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid number of minutes")
     
     def stop_timer(self):
         self.timer_active = False
-        self.remaining_time = 0
+        self._deadline = 0.0
         if hasattr(self, 'time_display'):
-            self.time_display.configure(text="00:00")
+            self._set(self.time_display, 'text', "00:00")
     
-    def update_content(self):
+    def update_content(self, now=None):
         if hasattr(self, 'time_display') and self.time_display.winfo_exists():
-            if self.timer_active and self.remaining_time > 0:
-                minutes = self.remaining_time // 60
-                seconds = self.remaining_time % 60
-                self.time_display.configure(text=f"{minutes:02d}:{seconds:02d}")
-                self.remaining_time -= 1
-            elif self.timer_active and self.remaining_time <= 0:
-                self.time_display.configure(text="TIME!")
-                self.timer_active = False
-                messagebox.showinfo("Timer", "Time's up!")
+            if not self.timer_active:
+                return
             
-            self.master.after(1000, self.update_content)
+            remaining = int(self._deadline - time.monotonic() + 0.999)
+            if remaining > 0:
+                self._set(self.time_display, 'text', f"{remaining // 60:02d}:{remaining % 60:02d}")
+            else:
+                self._set(self.time_display, 'text', "TIME!")
+                self.timer_active = False
+                # Modal box runs outside the shared tick so other widgets keep updating
+                self.time_display.after_idle(messagebox.showinfo, "Timer", "Time's up!")
 
 class WidgetManager:
     """Modern widget manager with desktop integration"""
     
+    # Customization dialog layout: card title -> (config key, label, kind, default)
+    _CUSTOMIZE_FIELDS = (
+        ("Size & Dimensions", (
+            ('width', "Width (px):", 'int', 200),
+            ('height', "Height (px):", 'int', 100),
+        )),
+        ("Colors & Theme", (
+            ('bg_color', "Background Color:", 'color', '#FFFFFF'),
+            ('text_color', "Text Color:", 'color', '#000000'),
+        )),
+        ("Typography", (
+            ('font_family', "Font Family:", 'font', 'Segoe UI'),
+            ('font_size', "Font Size:", 'int', 12),
+        )),
+        ("Transparency", (
+            ('opacity', "Opacity:", 'opacity', 1.0),
+        )),
+    )
+    
+    _FONT_FAMILIES = ('Segoe UI', 'Arial', 'Helvetica', 'Times New Roman', 'Courier New')
+    
+    # Toast colors per message type
+    _TOAST_COLORS = MappingProxyType({
+        "success": {"bg": "#4CAF50", "fg": "#FFFFFF"},
+        "error": {"bg": "#F44336", "fg": "#FFFFFF"},
+        "warning": {"bg": "#FF9800", "fg": "#FFFFFF"},
+        "info": {"bg": "#2196F3", "fg": "#FFFFFF"}
+    })
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Desktop Widget Manager")
@@ -666,12 +1050,13 @@ class WidgetManager:
         
         # Modern styling
         self.root.configure(bg='#F5F5F5')
-        style = ttk.Style()
-        style.theme_use('winnative')
+        # One ttk style for the app; dialogs reuse it instead of re-resolving theme data
+        self._ttk_style = ttk.Style(self.root)
+        self._ttk_style.theme_use('winnative')
         
         # Configure modern colors
-        style.configure('Modern.TFrame', background='#FFFFFF')
-        style.configure('Modern.TLabel', background='#FFFFFF', foreground='#1C1B1F')
+        self._ttk_style.configure('Modern.TFrame', background='#FFFFFF')
+        self._ttk_style.configure('Modern.TLabel', background='#FFFFFF', foreground='#1C1B1F')
         
         # Available widget types
         self.widget_types = {
@@ -681,13 +1066,78 @@ class WidgetManager:
             'Timer': TimerWidget
         }
         
-        self.active_widgets = []
-        self.desktop_widgets = []  # Track pinned widgets
+        self.active_widgets = {}  # widget id -> widget_info
+        self._next_widget_id = 0
+        self._row_to_id = []  # listbox row -> widget id
+        self._last_listbox_names = []  # rows currently shown in the listbox
+        self._pin_counter = 0  # monotonic, drives the pin stagger
         self.preview_window = None
+        self.preview_canvas = None
+        self._grid_image = None  # tiled grid strip, only alive while the preview is open
+        self._preview_after_id = None
+        
+        # Customization dialog, built on first use and then hidden/reused
+        self._customize_dialog = None
+        self._customize_header = None
+        self._customize_vars = {}
+        self._current_widget_info = None
+        self._customize_config = None
+        
+        self._toast_pool = {}  # toast type -> pooled toast window, see _show_toast
+        
+        # Main window position, tracked from <Configure> so toasts need no winfo calls
+        self._main_x = 0
+        self._main_y = 0
+        self.root.bind('<Configure>', self._on_root_configure)
+        
+        # Shared ticker driving all per-second widget updates; the Tcl command is
+        # registered once and reused instead of tkinter creating one per after() call
+        self._subscribers = weakref.WeakSet()
+        self._z_order_failed = False  # report a failing Z-order batch once, not every tick
+        BaseWidget.ticker = self
+        self._tick_cmd = self.root.register(self._tick)
+        self._schedule_tick()
+        
+        # Config file IO runs on a worker thread; results are polled back on the Tk thread
+        self._io_q = queue.Queue()
+        self._result_q = queue.Queue()
+        self._io_pending = 0
+        threading.Thread(target=self._io_worker, daemon=True).start()
         
         self.setup_modern_ui()
         self.load_config()
     
+    def subscribe(self, widget):
+        """Register a widget to receive the shared once-per-second tick"""
+        self._subscribers.add(widget)
+    
+    def _schedule_tick(self):
+        # Align to the next whole second so all clocks update in phase
+        delay = 1000 - int(time.time() * 1000) % 1000
+        self.root.tk.call('after', delay, self._tick_cmd)
+    
+    def _tick(self):
+        """Fan out a single timer wakeup to every subscribed widget"""
+        # Re-arm first so a failing or blocking subscriber cannot stop the ticker
+        self._schedule_tick()
+        now = datetime.now()
+        for widget in list(self._subscribers):
+            if not widget.on_tick(now):
+                self._subscribers.discard(widget)
+        self.reassert_z_order()
+    
+    def reassert_z_order(self):
+        """Push all pinned widgets back to desktop level in one batched call"""
+        hwnds = [dw.hwnd for dw in self._pinned_desktop_widgets() if dw.hwnd]
+        try:
+            DesktopWidget.defer_to_bottom(hwnds)
+        except Exception as e:
+            if not self._z_order_failed:
+                print(f"Could not reassert desktop Z-order: {e}")
+                self._z_order_failed = True
+        else:
+            self._z_order_failed = False
+    
     def setup_modern_ui(self):
         """Setup modern Material Design UI"""
         # Main container
@@ -702,7 +1152,7 @@ class WidgetManager:
         title_label = tk.Label(
             header_frame,
             text="Desktop Widget Manager",
-            font=("Segoe UI", 24, "normal"),
+            font=get_font("Segoe UI", 24, "normal"),
             bg='#F5F5F5',
             fg='#1C1B1F'
         )
@@ -711,7 +1161,7 @@ class WidgetManager:
         subtitle_label = tk.Label(
             header_frame,
             text="Create and manage modern desktop widgets",
-            font=("Segoe UI", 12, "normal"),
+            font=get_font("Segoe UI", 12, "normal"),
             bg='#F5F5F5',
             fg='#49454F'
         )
@@ -734,7 +1184,7 @@ class WidgetManager:
         tk.Label(
             selection_frame,
             text="Select Widget Type",
-            font=("Segoe UI", 12, "bold"),
+            font=get_font("Segoe UI", 12, "bold"),
             bg='#FFFFFF',
             fg='#1C1B1F'
         ).pack(anchor='w', pady=(0, 8))
@@ -751,7 +1201,7 @@ class WidgetManager:
                 value=widget_type,
                 bg='#FFFFFF',
                 fg='#1C1B1F',
-                font=("Segoe UI", 10),
+                font=get_font("Segoe UI", 10),
                 selectcolor='#6750A4',
                 activebackground='#FFFFFF',
                 relief='flat',
@@ -796,6 +1246,13 @@ class WidgetManager:
             style="filled"
         ).pack(fill='x', pady=4)
         
+        ModernButton(
+            left_panel,
+            text="Pin All to Desktop",
+            command=self.pin_all_widgets,
+            style="tonal"
+        ).pack(fill='x', pady=4)
+        
         ModernButton(
             left_panel,
             text="Unpin Selected",
@@ -841,7 +1298,7 @@ class WidgetManager:
             listbox_frame,
             bg='#F7F2FA',
             fg='#1C1B1F',
-            font=("Segoe UI", 11),
+            font=get_font("Segoe UI", 11),
             relief='flat',
             bd=0,
             selectbackground='#6750A4',
@@ -877,7 +1334,7 @@ class WidgetManager:
             'desktop_widget': None
         }
         
-        self.active_widgets.append(widget_info)
+        self._add_widget_info(widget_info)
         
         # Automatically pin to desktop
         self.pin_widget_to_desktop(widget_info)
@@ -885,48 +1342,97 @@ class WidgetManager:
         self.update_widgets_list()
         self.show_success_message(f"{widget_type} widget created and pinned to desktop!")
     
+    def _add_widget_info(self, widget_info):
+        """Register a widget under a new id and return the id"""
+        widget_id = self._next_widget_id
+        self._next_widget_id += 1
+        self.active_widgets[widget_id] = widget_info
+        return widget_id
+    
+    def _ensure_instance(self, widget_info):
+        """Construct a widget restored from a layout on first use"""
+        widget_instance = widget_info['instance']
+        if widget_instance is None:
+            widget_class = self.widget_types[widget_info['type']]
+            widget_instance = widget_class(self.root, widget_info.pop('config'))
+            widget_info['instance'] = widget_instance
+        return widget_instance
+    
+    def _widget_config(self, widget_info):
+        """Config of a widget, whether or not it has been constructed yet"""
+        widget_instance = widget_info['instance']
+        if widget_instance is None:
+            return widget_info['config']
+        return widget_instance.config
+    
+    def _pinned_desktop_widgets(self):
+        """Yield the DesktopWidget of every pinned widget"""
+        for widget_info in self.active_widgets.values():
+            if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
+                yield widget_info['desktop_widget']
+    
     def pin_widget_to_desktop(self, widget_info):
         """Pin a widget to the desktop"""
-        if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
-            return
-        
-        # Calculate position (stagger widgets)
-        x = 100 + (len(self.desktop_widgets) * 30)
-        y = 100 + (len(self.desktop_widgets) * 30)
-        
-        desktop_widget = DesktopWidget(widget_info['instance'], x, y)
-        desktop_widget.pin_to_desktop()
+        self.pin_all([widget_info])
+    
+    def pin_all(self, widget_infos=None):
+        """Pin widgets to the desktop in a single batch (all active widgets by default)"""
+        if widget_infos is None:
+            widget_infos = list(self.active_widgets.values())
         
-        widget_info['desktop_widget'] = desktop_widget
-        self.desktop_widgets.append(desktop_widget)
+        to_pin = []
+        for widget_info in widget_infos:
+            if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
+                continue
+            
+            # Calculate position (stagger widgets; unpinning never causes collisions)
+            i = self._pin_counter
+            self._pin_counter += 1
+            offset = (i % 20) * 30
+            desktop_widget = DesktopWidget(self._ensure_instance(widget_info), 100 + offset, 100 + offset)
+            widget_info['desktop_widget'] = desktop_widget
+            to_pin.append(desktop_widget)
+        
+        DesktopWidget.batch_pin(to_pin)
+        return len(to_pin)
     
     def pin_selected_widget(self):
         """Pin selected widget to desktop"""
         selection = self.widgets_listbox.curselection()
         if selection:
             index = selection[0]
-            widget_info = self.active_widgets[index]
+            widget_info = self.active_widgets[self._row_to_id[index]]
             
             if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
                 self.show_info_message("Widget is already pinned to desktop!")
                 return
             
-            self.pin_widget_to_desktop(widget_info)
+            self.pin_all([widget_info])
+            self.update_widgets_list()
             self.show_success_message(f"{widget_info['name']} pinned to desktop!")
         else:
             self.show_warning_message("Please select a widget to pin.")
     
+    def pin_all_widgets(self):
+        """Pin every unpinned widget to desktop"""
+        pinned_count = self.pin_all()
+        if pinned_count:
+            self.update_widgets_list()
+            self.show_success_message(f"Pinned {pinned_count} widgets to desktop!")
+        else:
+            self.show_info_message("All widgets are already pinned to desktop.")
+    
     def unpin_selected_widget(self):
         """Unpin selected widget from desktop"""
         selection = self.widgets_listbox.curselection()
         if selection:
             index = selection[0]
-            widget_info = self.active_widgets[index]
+            widget_info = self.active_widgets[self._row_to_id[index]]
             
             if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
                 widget_info['desktop_widget'].unpin_from_desktop()
-                self.desktop_widgets.remove(widget_info['desktop_widget'])
                 widget_info['desktop_widget'] = None
+                self.update_widgets_list()
                 self.show_success_message(f"{widget_info['name']} unpinned from desktop!")
             else:
                 self.show_info_message("Widget is not currently pinned to desktop.")
@@ -938,19 +1444,17 @@ class WidgetManager:
         selection = self.widgets_listbox.curselection()
         if selection:
             index = selection[0]
-            widget_info = self.active_widgets[index]
+            widget_info = self.active_widgets[self._row_to_id[index]]
             
             # Unpin from desktop if pinned
             if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
                 widget_info['desktop_widget'].unpin_from_desktop()
-                if widget_info['desktop_widget'] in self.desktop_widgets:
-                    self.desktop_widgets.remove(widget_info['desktop_widget'])
             
             # Clean up widget resources
             if hasattr(widget_info['instance'], 'cleanup'):
                 widget_info['instance'].cleanup()
             
-            del self.active_widgets[index]
+            del self.active_widgets[self._row_to_id[index]]
             self.update_widgets_list()
             self.show_success_message("Widget removed successfully!")
         else:
@@ -961,24 +1465,46 @@ class WidgetManager:
         selection = self.widgets_listbox.curselection()
         if selection:
             index = selection[0]
-            widget_info = self.active_widgets[index]
+            widget_info = self.active_widgets[self._row_to_id[index]]
+            self._ensure_instance(widget_info)
             self.open_modern_customization_dialog(widget_info)
         else:
             self.show_warning_message("Please select a widget to customize.")
     
     def open_modern_customization_dialog(self, widget_info):
-        """Open modern customization dialog"""
+        """Open modern customization dialog (built once, then reused)"""
+        dialog = self._customize_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._build_customization_dialog()
+        
+        self._current_widget_info = widget_info
+        self._customize_config = config = widget_info['instance'].config
+        
+        # Load the selected widget's values into the shared fields
+        for _, fields in self._CUSTOMIZE_FIELDS:
+            for key, _, _, default in fields:
+                self._customize_vars[key].set(config.get(key, default))
+        
+        # Loading values is not an edit; drop the live preview it scheduled
+        self._cancel_preview()
+        
+        title = f"Customize {widget_info['name']}"
+        dialog.title(title)
+        self._customize_header.configure(text=title)
+        dialog.deiconify()
+        dialog.grab_set()
+    
+    def _build_customization_dialog(self):
+        """Create the customization dialog tree; it is hidden, not destroyed, on close"""
         dialog = tk.Toplevel(self.root)
-        dialog.title(f"Customize {widget_info['name']}")
+        dialog.withdraw()
         dialog.geometry("500x600")
         dialog.configure(bg='#F5F5F5')
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_customization_dialog)
         
         # Center the dialog
         dialog.transient(self.root)
         
-        config = widget_info['instance'].config
-        
         # Main container
         main_frame = tk.Frame(dialog, bg='#F5F5F5', padx=20, pady=20)
         main_frame.pack(fill='both', expand=True)
@@ -986,8 +1512,7 @@ class WidgetManager:
         # Header
         header = tk.Label(
             main_frame,
-            text=f"Customize {widget_info['name']}",
-            font=("Segoe UI", 18, "bold"),
+            font=get_font("Segoe UI", 18, "bold"),
             bg='#F5F5F5',
             fg='#1C1B1F'
         )
@@ -1006,101 +1531,20 @@ class WidgetManager:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Size settings card
-        size_card = ModernCard(scrollable_frame, title="Size & Dimensions")
-        size_card.pack(fill='x', pady=(0, 16))
-        
-        size_content = tk.Frame(size_card, bg='#FFFFFF', padx=20, pady=16)
-        size_content.pack(fill='x')
-        
-        # Width
-        width_frame = tk.Frame(size_content, bg='#FFFFFF')
-        width_frame.pack(fill='x', pady=4)
-        tk.Label(width_frame, text="Width (px):", font=("Segoe UI", 10), bg='#FFFFFF', fg='#1C1B1F').pack(side='left')
-        width_var = tk.StringVar(value=str(config.get('width', 200)))
-        width_entry = tk.Entry(width_frame, textvariable=width_var, font=("Segoe UI", 10), bg='#F7F2FA', relief='flat', bd=5)
-        width_entry.pack(side='right', padx=(10, 0))
-        
-        # Height
-        height_frame = tk.Frame(size_content, bg='#FFFFFF')
-        height_frame.pack(fill='x', pady=4)
-        tk.Label(height_frame, text="Height (px):", font=("Segoe UI", 10), bg='#FFFFFF', fg='#1C1B1F').pack(side='left')
-        height_var = tk.StringVar(value=str(config.get('height', 100)))
-        height_entry = tk.Entry(height_frame, textvariable=height_var, font=("Segoe UI", 10), bg='#F7F2FA', relief='flat', bd=5)
-        height_entry.pack(side='right', padx=(10, 0))
-        
-        # Colors card
-        colors_card = ModernCard(scrollable_frame, title="Colors & Theme")
-        colors_card.pack(fill='x', pady=(0, 16))
-        
-        colors_content = tk.Frame(colors_card, bg='#FFFFFF', padx=20, pady=16)
-        colors_content.pack(fill='x')
-        
-        bg_color_var = tk.StringVar(value=config.get('bg_color', '#FFFFFF'))
-        text_color_var = tk.StringVar(value=config.get('text_color', '#000000'))
-        
-        # Background color
-        bg_frame = tk.Frame(colors_content, bg='#FFFFFF')
-        bg_frame.pack(fill='x', pady=4)
-        tk.Label(bg_frame, text="Background Color:", font=("Segoe UI", 10), bg='#FFFFFF', fg='#1C1B1F').pack(side='left')
-        bg_preview = tk.Frame(bg_frame, width=30, height=20, bg=bg_color_var.get(), relief='solid', bd=1)
-        bg_preview.pack(side='right', padx=(5, 0))
-        ModernButton(bg_frame, text="Choose", command=lambda: self.choose_color_modern(bg_color_var, bg_preview), style="outlined").pack(side='right', padx=(10, 5))
-        
-        # Text color
-        text_frame = tk.Frame(colors_content, bg='#FFFFFF')
-        text_frame.pack(fill='x', pady=4)
-        tk.Label(text_frame, text="Text Color:", font=("Segoe UI", 10), bg='#FFFFFF', fg='#1C1B1F').pack(side='left')
-        text_preview = tk.Frame(text_frame, width=30, height=20, bg=text_color_var.get(), relief='solid', bd=1)
-        text_preview.pack(side='right', padx=(5, 0))
-        ModernButton(text_frame, text="Choose", command=lambda: self.choose_color_modern(text_color_var, text_preview), style="outlined").pack(side='right', padx=(10, 5))
-        
-        # Font settings card
-        font_card = ModernCard(scrollable_frame, title="Typography")
-        font_card.pack(fill='x', pady=(0, 16))
-        
-        font_content = tk.Frame(font_card, bg='#FFFFFF', padx=20, pady=16)
-        font_content.pack(fill='x')
-        
-        # Font family
-        family_frame = tk.Frame(font_content, bg='#FFFFFF')
-        family_frame.pack(fill='x', pady=4)
-        tk.Label(family_frame, text="Font Family:", font=("Segoe UI", 10), bg='#FFFFFF', fg='#1C1B1F').pack(side='left')
-        font_family_var = tk.StringVar(value=config.get('font_family', 'Segoe UI'))
-        font_combo = ttk.Combobox(family_frame, textvariable=font_family_var, values=['Segoe UI', 'Arial', 'Helvetica', 'Times New Roman', 'Courier New'])
-        font_combo.pack(side='right', padx=(10, 0))
-        
-        # Font size
-        size_frame = tk.Frame(font_content, bg='#FFFFFF')
-        size_frame.pack(fill='x', pady=4)
-        tk.Label(size_frame, text="Font Size:", font=("Segoe UI", 10), bg='#FFFFFF', fg='#1C1B1F').pack(side='left')
-        font_size_var = tk.StringVar(value=str(config.get('font_size', 12)))
-        size_entry = tk.Entry(size_frame, textvariable=font_size_var, font=("Segoe UI", 10), bg='#F7F2FA', relief='flat', bd=5)
-        size_entry.pack(side='right', padx=(10, 0))
-        
-        # Opacity card
-        opacity_card = ModernCard(scrollable_frame, title="Transparency")
-        opacity_card.pack(fill='x', pady=(0, 16))
-        
-        opacity_content = tk.Frame(opacity_card, bg='#FFFFFF', padx=20, pady=16)
-        opacity_content.pack(fill='x')
-        
-        opacity_var = tk.DoubleVar(value=config.get('opacity', 1.0))
-        tk.Label(opacity_content, text="Opacity:", font=("Segoe UI", 10), bg='#FFFFFF', fg='#1C1B1F').pack(anchor='w')
-        opacity_scale = tk.Scale(
-            opacity_content,
-            from_=0.1,
-            to=1.0,
-            resolution=0.1,
-            variable=opacity_var,
-            orient='horizontal',
-            bg='#FFFFFF',
-            fg='#6750A4',
-            troughcolor='#E8DEF8',
-            highlightthickness=0,
-            relief='flat'
-        )
-        opacity_scale.pack(fill='x', pady=(8, 0))
+        # One card per section, one row per field
+        field_vars = {}
+        for card_title, fields in self._CUSTOMIZE_FIELDS:
+            card = ModernCard(scrollable_frame, title=card_title)
+            card.pack(fill='x', pady=(0, 16))
+            
+            card_content = tk.Frame(card, bg='#FFFFFF', padx=20, pady=16)
+            card_content.pack(fill='x')
+            
+            for spec in fields:
+                field_vars[spec[0]] = self._make_row(card_content, spec)
+        
+        int_vars = [field_vars[key] for _, fields in self._CUSTOMIZE_FIELDS
+                    for key, _, kind, _ in fields if kind == 'int']
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -1109,78 +1553,144 @@ class WidgetManager:
         button_frame = tk.Frame(main_frame, bg='#F5F5F5')
         button_frame.pack(fill='x', pady=(20, 0))
         
+        # The dialog is shared, so the widget being edited is read at call time
         def apply_changes():
+            widget_info = self._current_widget_info
+            config = self._customize_config
             try:
                 # Update configuration
                 old_config = config.copy()
-                config['width'] = int(width_var.get())
-                config['height'] = int(height_var.get())
-                config['bg_color'] = bg_color_var.get()
-                config['text_color'] = text_color_var.get()
-                config['font_family'] = font_family_var.get()
-                config['font_size'] = int(font_size_var.get())
-                config['opacity'] = opacity_var.get()
+                config.update({key: var.get() for key, var in field_vars.items()})
+                
+                # Live preview may have swapped in a temporary config
+                widget_info['instance'].config = config
                 
-                # Update desktop widget if pinned
+                # Update desktop widget in place if pinned
                 if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
-                    # Store position
-                    old_x = widget_info['desktop_widget'].x
-                    old_y = widget_info['desktop_widget'].y
-                    
-                    # Unpin and re-pin with new configuration
-                    widget_info['desktop_widget'].unpin_from_desktop()
-                    widget_info['desktop_widget'] = DesktopWidget(widget_info['instance'], old_x, old_y)
-                    widget_info['desktop_widget'].pin_to_desktop()
+                    widget_info['desktop_widget'].apply_config()
                 
-                # Update preview if open
-                if hasattr(self, 'preview_canvas') and self.preview_canvas:
-                    self.refresh_preview()
+                # Update preview if open; only a size change needs the items rebuilt
+                if self.preview_canvas is not None:
+                    changed = {k for k in config if old_config.get(k) != config[k]}
+                    if changed.isdisjoint(('width', 'height')):
+                        self._patch_preview_item(widget_info)
+                    else:
+                        self.refresh_preview()
                 
                 self.show_success_message("Widget customization applied successfully!")
-                dialog.destroy()
-            except ValueError as e:
+                self._hide_customization_dialog()
+            except (ValueError, tk.TclError) as e:
                 self.show_error_message(f"Invalid input: {e}")
         
         def preview_changes():
             """Live preview of changes"""
+            # Skip half-typed values cheaply (on the raw entry text) instead of
+            # letting IntVar.get() raise
+            if not all(_INT_RE.fullmatch(str(dialog.getvar(str(var)))) for var in int_vars):
+                return
+            
+            widget_info = self._current_widget_info
             try:
                 # Create temporary config
-                temp_config = config.copy()
-                temp_config.update({
-                    'width': int(width_var.get()),
-                    'height': int(height_var.get()),
-                    'bg_color': bg_color_var.get(),
-                    'text_color': text_color_var.get(),
-                    'font_family': font_family_var.get(),
-                    'font_size': int(font_size_var.get()),
-                    'opacity': opacity_var.get()
-                })
+                temp_config = self._customize_config.copy()
+                temp_config.update({key: var.get() for key, var in field_vars.items()})
                 
-                # Update desktop widget temporarily for preview
+                # Update desktop widget in place for preview
                 if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
                     widget_info['instance'].config = temp_config
-                    # Store position
-                    old_x = widget_info['desktop_widget'].x
-                    old_y = widget_info['desktop_widget'].y
-                    
-                    # Re-create with new config
-                    widget_info['desktop_widget'].unpin_from_desktop()
-                    widget_info['desktop_widget'] = DesktopWidget(widget_info['instance'], old_x, old_y)
-                    widget_info['desktop_widget'].pin_to_desktop()
-            except ValueError:
+                    widget_info['desktop_widget'].apply_config()
+            except (ValueError, tk.TclError):
                 pass  # Ignore invalid inputs during preview
         
-        # Add live preview bindings
-        for var in [width_var, height_var, font_size_var]:
-            var.trace('w', lambda *args: self.root.after(500, preview_changes))
+        # Add live preview bindings, debounced so a burst of edits previews once
+        for var in field_vars.values():
+            var.trace_add('write', lambda *args: self._schedule_preview(preview_changes))
         
-        for var in [bg_color_var, text_color_var, font_family_var]:
-            var.trace('w', lambda *args: self.root.after(100, preview_changes))
+        def cleanup(event):
+            # Unregister every trace (preview and swatch) and any pending preview
+            # so nothing keeps the dialog tree alive once it is really destroyed
+            if event.widget is dialog:
+                self._cancel_preview()
+                for var in field_vars.values():
+                    for mode, cbname in var.trace_info():
+                        var.trace_remove(mode, cbname)
+                self._customize_dialog = None
         
-        opacity_var.trace('w', lambda *args: self.root.after(100, preview_changes))
+        dialog.bind("<Destroy>", cleanup)
         
-        ModernButton(button_frame, text="Cancel", command=dialog.destroy, style="outlined").pack(side='right', padx=(8, 0))
+        ModernButton(button_frame, text="Cancel", command=self._hide_customization_dialog, style="outlined").pack(side='right', padx=(8, 0))
         ModernButton(button_frame, text="Apply Changes", command=apply_changes, style="filled").pack(side='right')
+        
+        self._customize_dialog = dialog
+        self._customize_header = header
+        self._customize_vars = field_vars
+        return dialog
+    
+    def _hide_customization_dialog(self):
+        """Hide the customization dialog so the next open can reuse it"""
+        self._cancel_preview()
+        self._customize_dialog.grab_release()
+        self._customize_dialog.withdraw()
+    
+    def _make_row(self, parent, spec):
+        """Build one customization row from a field spec and return its variable"""
+        key, label_text, kind, value = spec
+        
+        row = tk.Frame(parent, bg='#FFFFFF')
+        label = tk.Label(row, text=label_text, font=get_font("Segoe UI", 10), bg='#FFFFFF', fg='#1C1B1F')
+        
+        if kind == 'opacity':
+            row.pack(fill='x')
+            label.pack(anchor='w')
+            var = tk.DoubleVar(value=value)
+            tk.Scale(
+                row,
+                from_=0.1,
+                to=1.0,
+                resolution=0.1,
+                variable=var,
+                orient='horizontal',
+                bg='#FFFFFF',
+                fg='#6750A4',
+                troughcolor='#E8DEF8',
+                highlightthickness=0,
+                relief='flat'
+            ).pack(fill='x', pady=(8, 0))
+            return var
+        
+        row.pack(fill='x', pady=4)
+        label.pack(side='left')
+        
+        if kind == 'int':
+            var = tk.IntVar(value=value)
+            tk.Entry(row, textvariable=var, font=get_font("Segoe UI", 10), bg='#F7F2FA', relief='flat', bd=5).pack(side='right', padx=(10, 0))
+        elif kind == 'color':
+            var = tk.StringVar(value=value)
+            preview = tk.Frame(row, width=30, height=20, bg=value, relief='solid', bd=1)
+            preview.pack(side='right', padx=(5, 0))
+            # Keep the swatch in sync when the dialog is refilled for another widget
+            var.trace_add('write', lambda *args: preview.configure(bg=var.get()))
+            ModernButton(row, text="Choose", command=lambda: self.choose_color_modern(var, preview), style="outlined").pack(side='right', padx=(10, 5))
+        else:  # font
+            var = tk.StringVar(value=value)
+            ttk.Combobox(row, textvariable=var, values=self._FONT_FAMILIES).pack(side='right', padx=(10, 0))
+        return var
+    
+    def _schedule_preview(self, callback, delay=250):
+        """Debounce live preview: restart the delay on every change"""
+        self._cancel_preview()
+        
+        def run():
+            self._preview_after_id = None
+            callback()
+        
+        self._preview_after_id = self.root.after(delay, run)
+    
+    def _cancel_preview(self):
+        """Drop a pending live preview, if any"""
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
     
     def choose_color_modern(self, color_var, preview_widget):
         """Modern color chooser with preview"""
@@ -1191,7 +1701,7 @@ class WidgetManager:
     
     def open_desktop_preview(self):
         """Open interactive preview window with real-time positioning"""
-        if self.preview_window and self.preview_window.winfo_exists():
+        if self.preview_window is not None:
             self.preview_window.lift()
             return
         
@@ -1203,6 +1713,7 @@ class WidgetManager:
         self.preview_window.title("Interactive Desktop Preview")
         self.preview_window.geometry(f"{int(screen_width*0.9)}x{int(screen_height*0.9)}")
         self.preview_window.configure(bg='#1E1E1E')
+        self.preview_window.protocol("WM_DELETE_WINDOW", self.close_desktop_preview)
         
         # Make preview window stay on top during positioning
         self.preview_window.wm_attributes("-topmost", True)
@@ -1218,7 +1729,7 @@ class WidgetManager:
         title = tk.Label(
             header,
             text="Interactive Desktop Preview",
-            font=("Segoe UI", 16, "bold"),
+            font=get_font("Segoe UI", 16, "bold"),
             bg='#1E1E1E',
             fg='#FFFFFF'
         )
@@ -1245,7 +1756,7 @@ class WidgetManager:
         info_label = tk.Label(
             header,
             text="Drag widgets to position them. Changes apply in real-time to desktop.",
-            font=("Segoe UI", 9),
+            font=get_font("Segoe UI", 9),
             bg='#1E1E1E',
             fg='#B3B3B3'
         )
@@ -1272,22 +1783,37 @@ class WidgetManager:
         self.scale_x = canvas_width / screen_width
         self.scale_y = canvas_height / screen_height
         
+        # Scaled constants used by every preview redraw
+        self.scale_min = min(self.scale_x, self.scale_y)
+        self.grid_step_x = max(1, int(50 * self.scale_x))
+        self.grid_step_y = max(1, int(50 * self.scale_y))
+        self.preview_font_8 = get_font("Segoe UI", max(1, int(8 * self.scale_min)))
+        self.preview_font_9b = get_font("Segoe UI", max(1, int(9 * self.scale_min)), "bold")
+        self.preview_font_10 = get_font("Segoe UI", max(1, int(10 * self.scale_min)))
+        
         # Draw desktop elements
         self.draw_desktop_simulation()
         
         # Add interactive widgets
-        self.preview_widget_items = {}
+        self.preview_widget_items = []  # indexed by preview position
         self.add_interactive_widgets()
         
-        # Bind canvas events for widget interaction
-        self.preview_canvas.bind("<Button-1>", self.on_preview_click)
-        self.preview_canvas.bind("<B1-Motion>", self.on_preview_drag)
-        self.preview_canvas.bind("<ButtonRelease-1>", self.on_preview_release)
+        # Mouse events for widget items, bound once on the shared tag
+        self.preview_canvas.tag_bind("widget_any", "<Button-1>", self.on_preview_click)
+        self.preview_canvas.tag_bind("widget_any", "<B1-Motion>", self.on_preview_drag)
+        self.preview_canvas.tag_bind("widget_any", "<ButtonRelease-1>", self.on_preview_release)
         
         self.dragging_widget = None
         self.drag_start_x = 0
         self.drag_start_y = 0
     
+    def close_desktop_preview(self):
+        """Close the preview window and drop the references to its canvas"""
+        self.preview_window.destroy()
+        self.preview_window = None
+        self.preview_canvas = None
+        self._grid_image = None
+    
     def draw_desktop_simulation(self):
         """Draw realistic desktop simulation"""
         canvas_width = self.preview_canvas.winfo_width()
@@ -1296,21 +1822,17 @@ class WidgetManager:
         # Clear canvas
         self.preview_canvas.delete("desktop_element")
         
-        # Draw subtle grid
-        for i in range(0, canvas_width, int(50 * self.scale_x)):
-            self.preview_canvas.create_line(
-                i, 0, i, canvas_height, 
-                fill='#3A3A3A', width=1, dash=(1, 4), tags="desktop_element"
-            )
-        for i in range(0, canvas_height, int(50 * self.scale_y)):
-            self.preview_canvas.create_line(
-                0, i, canvas_width, i, 
-                fill='#3A3A3A', width=1, dash=(1, 4), tags="desktop_element"
+        # Draw subtle grid from one row-high tiled strip, shared by an image item per
+        # grid row, instead of a line item per step or a canvas-sized image
+        self._grid_image = self._build_grid_strip(canvas_width)
+        for y in range(0, max(1, canvas_height), self.grid_step_y):
+            self.preview_canvas.create_image(
+                0, y, anchor='nw', image=self._grid_image, tags="desktop_element"
             )
         
         # Simulate desktop icons (scaled)
-        icon_size = int(50 * min(self.scale_x, self.scale_y))
-        margin = int(20 * min(self.scale_x, self.scale_y))
+        icon_size = int(50 * self.scale_min)
+        margin = int(20 * self.scale_min)
         
         # My Computer
         self.preview_canvas.create_rectangle(
@@ -1321,7 +1843,7 @@ class WidgetManager:
         self.preview_canvas.create_text(
             margin + icon_size//2, margin + icon_size + 10,
             text="My Computer", fill='#FFFFFF', 
-            font=("Segoe UI", int(8 * min(self.scale_x, self.scale_y))), tags="desktop_element"
+            font=self.preview_font_8, tags="desktop_element"
         )
         
         # Recycle Bin
@@ -1333,7 +1855,7 @@ class WidgetManager:
         self.preview_canvas.create_text(
             margin + icon_size//2, margin + 2*icon_size + 40,
             text="Recycle Bin", fill='#FFFFFF',
-            font=("Segoe UI", int(8 * min(self.scale_x, self.scale_y))), tags="desktop_element"
+            font=self.preview_font_8, tags="desktop_element"
         )
         
         # Taskbar
@@ -1348,19 +1870,36 @@ class WidgetManager:
         self.preview_canvas.create_text(
             int(50 * self.scale_x), canvas_height - taskbar_height//2,
             text="⊞ Start", fill='#FFFFFF',
-            font=("Segoe UI", int(10 * min(self.scale_x, self.scale_y))), tags="desktop_element"
+            font=self.preview_font_10, tags="desktop_element"
         )
         
         # System tray area
         self.preview_canvas.create_text(
             canvas_width - int(100 * self.scale_x), canvas_height - taskbar_height//2,
             text="🔊 📶 🔋 12:34 PM", fill='#FFFFFF',
-            font=("Segoe UI", int(8 * min(self.scale_x, self.scale_y))), tags="desktop_element"
+            font=self.preview_font_8, tags="desktop_element"
         )
     
+    def _build_grid_strip(self, width, line='#3A3A3A', bg='#2D2D2D'):
+        """Render one dashed grid cell and tile it across a single row-high strip"""
+        step_x, step_y = self.grid_step_x, self.grid_step_y
+        rows = []
+        for y in range(step_y):
+            row = [line if (x == 0 and y % 5 == 0) or (y == 0 and x % 5 == 0) else bg
+                   for x in range(step_x)]
+            rows.append("{" + " ".join(row) + "}")
+        
+        tile = tk.PhotoImage(width=step_x, height=step_y)
+        tile.put(" ".join(rows))
+        
+        # Photo copy replicates the source when the target region is larger
+        strip = tk.PhotoImage(width=max(1, width), height=step_y)
+        strip.tk.call(strip, 'copy', tile, '-to', 0, 0, max(1, width), step_y)
+        return strip
+    
     def add_interactive_widgets(self):
         """Add interactive widget representations"""
-        for i, widget_info in enumerate(self.active_widgets):
+        for i, widget_info in enumerate(self.active_widgets.values()):
             # Get current position or default
             if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
                 real_x = widget_info['desktop_widget'].x
@@ -1373,12 +1912,14 @@ class WidgetManager:
             canvas_x = int(real_x * self.scale_x)
             canvas_y = int(real_y * self.scale_y)
             
-            # Get widget dimensions (scaled)
-            widget_width = int(widget_info['instance'].config.get('width', 200) * self.scale_x)
-            widget_height = int(widget_info['instance'].config.get('height', 100) * self.scale_y)
+            # Read the widget's config once
+            cfg = self._widget_config(widget_info)
+            widget_bg = cfg.get('bg_color', '#FFFFFF')
+            widget_fg = cfg.get('text_color', '#000000')
             
-            # Create widget representation
-            widget_bg = widget_info['instance'].config.get('bg_color', '#FFFFFF')
+            # Get widget dimensions (scaled)
+            widget_width = int(cfg.get('width', 200) * self.scale_x)
+            widget_height = int(cfg.get('height', 100) * self.scale_y)
             
             # Widget background
             rect_id = self.preview_canvas.create_rectangle(
@@ -1387,51 +1928,55 @@ class WidgetManager:
                 fill=widget_bg,
                 outline='#6750A4',
                 width=2,
-                tags=f"widget_{i}"
+                tags=(f"widget_{i}", "widget_any")
             )
             
             # Widget title
             text_id = self.preview_canvas.create_text(
                 canvas_x + widget_width//2, canvas_y + 15,
                 text=widget_info['name'],
-                fill=widget_info['instance'].config.get('text_color', '#000000'),
-                font=("Segoe UI", int(9 * min(self.scale_x, self.scale_y)), "bold"),
-                tags=f"widget_{i}"
+                fill=widget_fg,
+                font=self.preview_font_9b,
+                tags=(f"widget_{i}", "widget_any")
             )
             
             # Widget type indicator
             type_id = self.preview_canvas.create_text(
                 canvas_x + widget_width//2, canvas_y + widget_height//2,
                 text=widget_info['type'],
-                fill=widget_info['instance'].config.get('text_color', '#000000'),
-                font=("Segoe UI", int(8 * min(self.scale_x, self.scale_y))),
-                tags=f"widget_{i}"
+                fill=widget_fg,
+                font=self.preview_font_8,
+                tags=(f"widget_{i}", "widget_any")
             )
             
             # Store widget info
-            self.preview_widget_items[i] = {
+            self.preview_widget_items.append({
                 'rect': rect_id,
                 'text': text_id,
                 'type': type_id,
                 'real_x': real_x,
                 'real_y': real_y,
                 'widget_info': widget_info
-            }
+            })
     
     def on_preview_click(self, event):
-        """Handle click on preview canvas"""
-        # Find clicked widget
-        clicked_item = self.preview_canvas.find_closest(event.x, event.y)[0]
-        
-        for i, item_data in self.preview_widget_items.items():
-            if clicked_item in [item_data['rect'], item_data['text'], item_data['type']]:
-                self.dragging_widget = i
-                self.drag_start_x = event.x
-                self.drag_start_y = event.y
-                
-                # Highlight selected widget
-                self.preview_canvas.itemconfig(item_data['rect'], outline='#FF5722', width=3)
+        """Handle click on a widget in the preview canvas"""
+        # The clicked item's widget_{i} tag names its preview index
+        index = None
+        for tag in self.preview_canvas.gettags("current"):
+            if tag.startswith("widget_") and tag != "widget_any":
+                index = int(tag[7:])
                 break
+        if index is None:
+            return
+        
+        item_data = self.preview_widget_items[index]
+        self.dragging_widget = index
+        self.drag_start_x = event.x
+        self.drag_start_y = event.y
+        
+        # Highlight selected widget
+        self.preview_canvas.itemconfig(item_data['rect'], outline='#FF5722', width=3)
     
     def on_preview_drag(self, event):
         """Handle dragging in preview"""
@@ -1450,14 +1995,10 @@ class WidgetManager:
             item_data['real_x'] += dx / self.scale_x
             item_data['real_y'] += dy / self.scale_y
             
-            # Update actual desktop widget position in real-time
+            # Update actual desktop widget position in real-time (coalesced per idle pass)
             widget_info = item_data['widget_info']
             if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
-                new_x = int(item_data['real_x'])
-                new_y = int(item_data['real_y'])
-                widget_info['desktop_widget'].desktop_window.geometry(f"+{new_x}+{new_y}")
-                widget_info['desktop_widget'].x = new_x
-                widget_info['desktop_widget'].y = new_y
+                widget_info['desktop_widget'].move_to(int(item_data['real_x']), int(item_data['real_y']))
             
             # Update drag start position
             self.drag_start_x = event.x
@@ -1475,7 +2016,7 @@ class WidgetManager:
     def apply_preview_positions(self):
         """Apply current preview positions to desktop widgets"""
         applied_count = 0
-        for item_data in self.preview_widget_items.values():
+        for item_data in self.preview_widget_items:
             widget_info = item_data['widget_info']
             if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
                 new_x = int(item_data['real_x'])
@@ -1489,7 +2030,7 @@ class WidgetManager:
     
     def reset_preview_positions(self):
         """Reset widget positions to default"""
-        for i, item_data in self.preview_widget_items.items():
+        for i, item_data in enumerate(self.preview_widget_items):
             # Default positions
             default_x = 200 + i * 50
             default_y = 150 + i * 50
@@ -1521,100 +2062,213 @@ class WidgetManager:
         
         self.show_success_message("Widget positions reset to default!")
     
+    def _patch_preview_item(self, widget_info):
+        """Recolor a widget's preview items in place"""
+        cfg = widget_info['instance'].config
+        for item_data in self.preview_widget_items:
+            if item_data['widget_info'] is widget_info:
+                widget_fg = cfg.get('text_color', '#000000')
+                self.preview_canvas.itemconfig(item_data['rect'], fill=cfg.get('bg_color', '#FFFFFF'))
+                self.preview_canvas.itemconfig(item_data['text'], fill=widget_fg)
+                self.preview_canvas.itemconfig(item_data['type'], fill=widget_fg)
+                break
+    
     def refresh_preview(self):
         """Refresh preview window with updated widgets"""
-        if hasattr(self, 'preview_canvas') and self.preview_canvas:
-            # Clear existing widgets
-            for i in range(len(self.active_widgets)):
-                self.preview_canvas.delete(f"widget_{i}")
+        if self.preview_canvas is not None:
+            # Clear existing widgets in a single canvas call
+            self.preview_canvas.delete("widget_any")
+            self.preview_widget_items.clear()
             
             # Re-add widgets
             self.add_interactive_widgets()
     
     def update_widgets_list(self):
         """Update the modern widgets listbox"""
-        self.widgets_listbox.delete(0, 'end')
-        for i, widget_info in enumerate(self.active_widgets):
+        self._row_to_id = list(self.active_widgets)
+        display_texts = []
+        for widget_info in self.active_widgets.values():
             status = " 📌" if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned else ""
-            display_text = f"{widget_info['name']}{status}"
-            self.widgets_listbox.insert('end', display_text)
+            display_texts.append(f"{widget_info['name']}{status}")
+        
+        # Leave the unchanged head and tail rows alone and rewrite only the
+        # middle (a new widget is a single append)
+        old_texts = self._last_listbox_names
+        start = 0
+        limit = min(len(old_texts), len(display_texts))
+        while start < limit and old_texts[start] == display_texts[start]:
+            start += 1
+        
+        old_end, new_end = len(old_texts), len(display_texts)
+        while old_end > start and new_end > start and old_texts[old_end - 1] == display_texts[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+        
+        if old_end > start:
+            self.widgets_listbox.delete(start, old_end - 1)
+        if new_end > start:
+            self.widgets_listbox.insert(start, *display_texts[start:new_end])
+        self._last_listbox_names = display_texts
     
-    def save_config(self):
-        """Save current configuration to file"""
-        config_data = {
-            'widgets': [],
-            'desktop_positions': {}
-        }
+    def save_config(self, pretty=False):
+        """Save current configuration to file (compact JSON unless pretty is set)"""
+        widget_config_of = self._widget_config
         
-        for i, widget_info in enumerate(self.active_widgets):
+        def pack(widget_info):
+            desktop_widget = widget_info['desktop_widget']
             widget_config = {
                 'type': widget_info['type'],
                 'name': widget_info['name'],
-                'config': widget_info['instance'].config
+                # Snapshot so the worker never reads a dict the GUI is mutating
+                'config': dict(widget_config_of(widget_info))
             }
             
             # Save desktop position if pinned
-            if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
-                widget_config['desktop_x'] = widget_info['desktop_widget'].x
-                widget_config['desktop_y'] = widget_info['desktop_widget'].y
+            if desktop_widget and desktop_widget.is_pinned:
+                widget_config['desktop_x'] = desktop_widget.x
+                widget_config['desktop_y'] = desktop_widget.y
                 widget_config['pinned'] = True
-            
-            config_data['widgets'].append(widget_config)
+            return widget_config
         
-        try:
-            with open('modern_widget_config.json', 'w') as f:
-                json.dump(config_data, f, indent=2)
-            self.show_success_message("Layout saved successfully!")
-        except Exception as e:
-            self.show_error_message(f"Failed to save layout: {e}")
+        config_data = {
+            'widgets': [pack(widget_info) for widget_info in self.active_widgets.values()],
+            'desktop_positions': {}
+        }
+        
+        self._submit_io('save', config_data, pretty)
     
     def load_config(self):
         """Load configuration from file"""
-        if not os.path.exists('modern_widget_config.json'):
+        self._submit_io('load')
+    
+    def _submit_io(self, op, data=None, pretty=False):
+        """Queue a config file operation for the IO worker"""
+        self._io_q.put((op, CONFIG_FILE, data, pretty))
+        self._io_pending += 1
+        if self._io_pending == 1:
+            self.root.after(100, self._poll_io)
+    
+    def _io_worker(self):
+        """Worker thread: read/write config files. Never touches Tk widgets."""
+        while True:
+            op, path, data, pretty = self._io_q.get()
+            try:
+                result = None
+                if op == 'save':
+                    # Write a sibling temp file and swap it in, so a crash mid-write
+                    # never leaves a truncated layout behind
+                    tmp_path = path + '.tmp'
+                    if HAS_ORJSON:
+                        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+                        with open(tmp_path, 'wb', buffering=CONFIG_BUFFER_SIZE) as f:
+                            f.write(orjson.dumps(data, option=option))
+                    else:
+                        # Encode first so the file gets one write, not one per token
+                        if pretty:
+                            payload = json.dumps(data, indent=2) + '\n'
+                        else:
+                            payload = json.dumps(data, separators=(',', ':')) + '\n'
+                        with open(tmp_path, 'w', buffering=CONFIG_BUFFER_SIZE) as f:
+                            f.write(payload)
+                    os.replace(tmp_path, path)
+                else:
+                    try:
+                        f = open(path, 'rb', buffering=CONFIG_BUFFER_SIZE)
+                    except FileNotFoundError:
+                        pass  # nothing saved yet
+                    else:
+                        with f:
+                            raw = f.read()
+                        result = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+                self._result_q.put((op, result, None))
+            except Exception as e:
+                self._result_q.put((op, None, e))
+    
+    def _poll_io(self):
+        """Handle finished config IO on the Tk thread; polls only while work is pending"""
+        try:
+            while True:
+                op, result, error = self._result_q.get_nowait()
+                self._io_pending -= 1
+                if op == 'save':
+                    self._on_config_saved(error)
+                else:
+                    self._on_config_loaded(result, error)
+        except queue.Empty:
+            pass
+        
+        if self._io_pending:
+            self.root.after(100, self._poll_io)
+    
+    def _on_config_saved(self, error):
+        if error:
+            self.show_error_message(f"Failed to save layout: {error}")
+        else:
+            self.show_success_message("Layout saved successfully!")
+    
+    def _on_config_loaded(self, config_data, error):
+        """Materialize widgets from parsed config data"""
+        if error:
+            self.show_error_message(f"Failed to load layout: {error}")
+            return
+        if config_data is None:
             return
         
         try:
-            with open('modern_widget_config.json', 'r') as f:
-                config_data = json.load(f)
+            # Clear existing widgets; only pinned ones own desktop windows. Their
+            # teardown redraws are left to one idle pass, never flushed per widget
+            for desktop_widget in self._pinned_desktop_widgets():
+                desktop_widget.unpin_from_desktop()
             
-            # Clear existing widgets
-            for widget_info in self.active_widgets:
-                if widget_info['desktop_widget'] and widget_info['desktop_widget'].is_pinned:
-                    widget_info['desktop_widget'].unpin_from_desktop()
-            
-            self.active_widgets = []
-            self.desktop_widgets = []
+            self.active_widgets = {}
+            to_pin = []
             
             # Load widgets
+            widget_types = self.widget_types
             for widget_data in config_data.get('widgets', []):
                 widget_type = widget_data['type']
-                if widget_type in self.widget_types:
-                    widget_class = self.widget_types[widget_type]
-                    widget_instance = widget_class(self.root, widget_data['config'])
-                    
+                if widget_type in widget_types:
+                    # Only metadata for now; the instance is built on first use
                     widget_info = {
                         'type': widget_type,
-                        'instance': widget_instance,
+                        'instance': None,
+                        'config': widget_data['config'],
                         'name': widget_data['name'],
                         'desktop_widget': None
                     }
                     
-                    self.active_widgets.append(widget_info)
+                    widget_id = self._add_widget_info(widget_info)
                     
                     # Restore desktop pinning if it was pinned
                     if widget_data.get('pinned', False):
-                        x = widget_data.get('desktop_x', 100)
-                        y = widget_data.get('desktop_y', 100)
-                        desktop_widget = DesktopWidget(widget_instance, x, y)
-                        desktop_widget.pin_to_desktop()
-                        widget_info['desktop_widget'] = desktop_widget
-                        self.desktop_widgets.append(desktop_widget)
+                        to_pin.append((widget_id, widget_data.get('desktop_x', 100), widget_data.get('desktop_y', 100)))
             
             self.update_widgets_list()
+            
+            # Pin restored widgets in one batch once the main window has painted
+            if to_pin:
+                self.root.after_idle(self._pin_restored, to_pin)
+            
             self.show_success_message("Layout loaded successfully!")
         except Exception as e:
             self.show_error_message(f"Failed to load layout: {e}")
     
+    def _pin_restored(self, pending):
+        """Pin widgets restored from a layout, skipping any removed or pinned meanwhile"""
+        to_pin = []
+        for widget_id, x, y in pending:
+            widget_info = self.active_widgets.get(widget_id)
+            if widget_info is None or widget_info['desktop_widget'] is not None:
+                continue
+            
+            # Pinned widgets are visible, so build their instance now
+            desktop_widget = DesktopWidget(self._ensure_instance(widget_info), x, y)
+            widget_info['desktop_widget'] = desktop_widget
+            to_pin.append(desktop_widget)
+        
+        DesktopWidget.batch_pin(to_pin)
+        self.update_widgets_list()
+    
     def show_success_message(self, message):
         """Show modern success message"""
         self._show_toast(message, "success")
@@ -1633,47 +2287,66 @@ class WidgetManager:
     
     def _show_toast(self, message, toast_type):
         """Show modern toast notification"""
-        colors = {
-            "success": {"bg": "#4CAF50", "fg": "#FFFFFF"},
-            "error": {"bg": "#F44336", "fg": "#FFFFFF"},
-            "warning": {"bg": "#FF9800", "fg": "#FFFFFF"},
-            "info": {"bg": "#2196F3", "fg": "#FFFFFF"}
-        }
+        if toast_type not in self._TOAST_COLORS:
+            toast_type = "info"
         
-        color_scheme = colors.get(toast_type, colors["info"])
+        # One pooled window per toast type: [toplevel, label, pending hide job]
+        entry = self._toast_pool.get(toast_type)
+        if entry is None:
+            color_scheme = self._TOAST_COLORS[toast_type]
+            
+            toast = tk.Toplevel(self.root)
+            toast.withdraw()
+            toast.overrideredirect(True)
+            toast.configure(bg=color_scheme["bg"])
+            
+            # Toast content
+            toast_frame = tk.Frame(toast, bg=color_scheme["bg"], padx=16, pady=12)
+            toast_frame.pack(fill='both', expand=True)
+            
+            message_label = tk.Label(
+                toast_frame,
+                bg=color_scheme["bg"],
+                fg=color_scheme["fg"],
+                font=get_font("Segoe UI", 10),
+                wraplength=250
+            )
+            message_label.pack()
+            
+            entry = self._toast_pool[toast_type] = [toast, message_label, None]
         
-        toast = tk.Toplevel(self.root)
-        toast.overrideredirect(True)
-        toast.configure(bg=color_scheme["bg"])
+        toast, message_label, hide_job = entry
+        if hide_job is not None:
+            toast.after_cancel(hide_job)
+        message_label.configure(text=message)
         
         # Position at top-right of main window
-        main_x = self.root.winfo_x()
-        main_y = self.root.winfo_y()
-        toast.geometry(f"300x60+{main_x + 400}+{main_y + 50}")
-        
-        # Toast content
-        toast_frame = tk.Frame(toast, bg=color_scheme["bg"], padx=16, pady=12)
-        toast_frame.pack(fill='both', expand=True)
-        
-        message_label = tk.Label(
-            toast_frame,
-            text=message,
-            bg=color_scheme["bg"],
-            fg=color_scheme["fg"],
-            font=("Segoe UI", 10),
-            wraplength=250
-        )
-        message_label.pack()
-        
-        # Auto-close after 3 seconds
-        toast.after(3000, toast.destroy)
+        toast.geometry(f"300x60+{self._main_x + 400}+{self._main_y + 50}")
         
-        # Make it fade-in effect
         toast.attributes('-alpha', 0.0)
-        for i in range(1, 11):
-            toast.attributes('-alpha', i/10.0)
-            toast.update()
-            time.sleep(0.02)
+        toast.deiconify()
+        
+        # Auto-hide after 3 seconds; the window is kept for the next toast
+        entry[2] = toast.after(3000, self._hide_toast, entry)
+        
+        # Fade in on the Tk scheduler so the event loop keeps running
+        def fade(step=1):
+            toast.attributes('-alpha', step / 10.0)
+            if step < 10:
+                toast.after(20, fade, step + 1)
+        
+        toast.after(0, fade)
+    
+    def _on_root_configure(self, event):
+        """Remember where the main window is (child widgets' events are ignored)"""
+        if event.widget is self.root:
+            self._main_x = event.x
+            self._main_y = event.y
+    
+    def _hide_toast(self, entry):
+        """Hide a pooled toast window"""
+        entry[2] = None
+        entry[0].withdraw()
     
     def run(self):
         """Start the modern application"""